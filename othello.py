@@ -2,7 +2,11 @@
 Interactive Othello game with a minimax-based AI opponent.
 """
 
+import functools
+import random
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import List, Optional, Sequence, Tuple, Union
 
 import pygame
@@ -12,6 +16,18 @@ INITIAL_STATE = ('........',) * 3 + ('...XO...', '...OX...') + ('........',) * 3
 DIRECTIONS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
 
 
+# RAYS[r * 8 + c] lists, for each direction, the squares (as indices r * 8 + c) walking away from (r, c) to the edge.
+# Rays shorter than two squares are left out since they can never capture anything.
+SQUARES = tuple((r, c) for r in range(8) for c in range(8))
+RAYS = tuple(
+    tuple(ray for ray in (
+        tuple((r + k * dr) * 8 + c + k * dc for k in range(1, 8) if 0 <= r + k * dr < 8 and 0 <= c + k * dc < 8)
+        for dr, dc in DIRECTIONS
+    ) if len(ray) >= 2)
+    for r, c in SQUARES
+)
+
+
 def flips(board, player, location):
     """
     :param board: A sequence of strings
@@ -19,24 +35,31 @@ def flips(board, player, location):
     :param location: A pair (r, c) with 0 <= r < 8 and 0 <= c < 8
     :return: A collection of pairs of locations of opponent's pieces that would be flipped by this move
     """
-    def f(r, c, dr, dc):  # Find flips starting at (r, c) and looking in direction (dr, dc)
-        line = []
-        while True:
-            r, c = (r + dr, c + dc)
-            if not (0 <= r < 8 and 0 <= c < 8):
-                return []  # Edge of board -- no capture
-            if board[r][c] == '.':
-                return []  # Empty space -- no capture
-            if board[r][c] == player:
-                return line  # Friendly piece -- capture all opposing pieces seen so far
-            line.append((r, c))
+    r, c = location
+    return cell_flips(''.join(board), player, r * 8 + c)
+
+
+def cell_flips(cells, player, index):
+    """
+    :param cells: The board flattened into a single 64-character string, i.e. ''.join(board)
+    :param player: 'X' or 'O'
+    :param index: The square r * 8 + c being played
+    :return: Same as flips(board, player, (r, c))
+    """
     result = []
-    for d in DIRECTIONS:
-        result.extend(f(*location, *d))
+    for ray in RAYS[index]:
+        line = []
+        for idx in ray:
+            here = cells[idx]
+            if here == player:
+                result.extend(line)  # Friendly piece -- capture all opposing pieces seen so far
+                break
+            if here == '.':
+                break  # Empty space -- no capture
+            line.append(SQUARES[idx])
     return result
 
 
-
 def successor(board, player, move):
     """
     :param board: A sequence of strings
@@ -44,43 +67,71 @@ def successor(board, player, move):
     :param move: Either 'pass' or a pair (r, c) with 0 <= r < 8 and 0 <= c < 8
     :return: The board that would result if player played move
     """
+    if move == 'pass':
+        return board
+    return apply_move(board, player, move, flips(board, player, move))
+
+
+def apply_move(board, player, move, flipped):
+    """
+    :param board: A sequence of strings
+    :param player: 'X' or 'O'
+    :param move: Either 'pass' or a pair (r, c) with 0 <= r < 8 and 0 <= c < 8
+    :param flipped: flips(board, player, move), e.g. as already returned by legal_move_flips
+    :return: The board that would result if player played move
+    """
     if move == 'pass':
         return board
 
+    # Edit one flat buffer in place and slice the rows back out, rather than copying the board row by row
     r, c = move
-    result = [list(row) for row in board] #tuple to list of list
-    result[r][c] = player
-    for row, col in flips(board, player, move):
-        result[row][col] = player
+    cells = bytearray(''.join(board), 'ascii')
+    mark = ord(player)
+    cells[r * 8 + c] = mark
+    for row, col in flipped:
+        cells[row * 8 + col] = mark
 
-    return tuple(map("".join, result)) #found that on stackoverflow and it seems to work
+    cells = cells.decode('ascii')
+    return tuple(cells[i:i + 8] for i in range(0, 64, 8))
 
 
 
-def legal_moves(board, player):
+def legal_move_flips(board, player):
     """
     :param board: A sequence of strings
     :param player: 'X' or 'O'
-    :return: A collection of legal moves for player from board; each is (r, c). Returns an empty collection if neither
-    player has a legal move or ['pass'] if player cannot make a capturing move.
+    :return: A list of pairs (move, flips) for each legal move of player from board, where flips is what
+    flips(board, player, move) returns. Returns an empty list if neither player has a legal move or [('pass', [])] if
+    player cannot make a capturing move.
     """
+    cells = ''.join(board)
+    other = OPPONENT[player]
     result = []
     game_over = True
-    for r in range(8):
-        for c in range(8):
-            if board[r][c] == '.':
-                here = (r, c)
-                if flips(board, player, here):
-                    game_over = False
-                    result.append(here)
-                # The inclusion of game_over in the condition below is for efficiency:
-                # If it has already been determined that the game is not over, there's no need to check
-                # for opposing legal moves
-                elif game_over and flips(board, opposite(player), here):
-                    game_over = False
+    for index in range(64):
+        if cells[index] == '.':
+            flipped = cell_flips(cells, player, index)
+            if flipped:
+                game_over = False
+                result.append((SQUARES[index], flipped))
+            # The inclusion of game_over in the condition below is for efficiency:
+            # If it has already been determined that the game is not over, there's no need to check
+            # for opposing legal moves
+            elif game_over and cell_flips(cells, other, index):
+                game_over = False
     if result or game_over:
         return result
-    return ['pass']
+    return [('pass', [])]
+
+
+def legal_moves(board, player):
+    """
+    :param board: A sequence of strings
+    :param player: 'X' or 'O'
+    :return: A collection of legal moves for player from board; each is (r, c). Returns an empty collection if neither
+    player has a legal move or ['pass'] if player cannot make a capturing move.
+    """
+    return [move for move, _ in legal_move_flips(board, player)]
 
 
 def score(board):
@@ -89,25 +140,218 @@ def score(board):
     :return: The difference between the number of pieces 'X' has and the number 'O' has. This is therefore positive if
     'X' is winning, negative if 'O' is winning, and 0 if the score is tied.
     """
-    count_x = 0
-    count_o = 0
-    x = 'X'
-    o = 'O'
+    cells = ''.join(board)
+    return cells.count('X') - cells.count('O')
+
+
+# A plain lookup is cheaper than a function call in the search, which needs the other player at every node
+OPPONENT = {'X': 'O', 'O': 'X'}
+opposite = OPPONENT.__getitem__
+
+
+
+# Bitboards: the search works on a pair of 64-bit ints (own, opp) holding the discs of the side to move and of its
+# opponent. Square (r, c) is bit r * 8 + c. The string boards above are only used at the UI boundary.
+FULL = (1 << 64) - 1
+NOT_COL_0 = FULL ^ sum(1 << (r * 8) for r in range(8))
+NOT_COL_7 = FULL ^ sum(1 << (r * 8 + 7) for r in range(8))
+
+
+def to_bitboards(board, player):
+    """
+    :param board: A sequence of strings
+    :param player: 'X' or 'O'
+    :return: A pair (own, opp) of bitboards holding player's discs and the opponent's discs
+    """
+    own = opp = 0
+    other = OPPONENT[player]
     for r in range(8):
         for c in range(8):
-            if board[r][c] != '.':
-                here = board[r][c]
-                if here == x:
-                    count_x+=1
-                elif here == o:
-                    count_o+=1
-    return count_x - count_o
+            if board[r][c] == player:
+                own |= 1 << (r * 8 + c)
+            elif board[r][c] == other:
+                opp |= 1 << (r * 8 + c)
+    return own, opp
 
 
-def opposite(player):
-    if player == 'X':
-        return 'O'
-    return 'X'
+def move_mask(own, opp):
+    """
+    :param own: Bitboard of the side to move
+    :param opp: Bitboard of its opponent
+    :return: Bitboard of the empty squares where own can make a capturing move
+    """
+    empty = FULL ^ (own | opp)
+    inner = opp & NOT_COL_0 & NOT_COL_7  # A sideways line can't wrap around the edge through these discs
+    moves = 0
+    # Each pair of opposite directions shares a shift amount. The fills are written out in full (a line holds at
+    # most 6 opposing discs) since this is the hottest function in the search. Bits shifted past square 63 are
+    # removed by the final & empty.
+    for amount, line in ((1, inner), (8, opp), (7, inner), (9, inner)):
+        x = (own << amount) & line
+        x |= (x << amount) & line
+        x |= (x << amount) & line
+        x |= (x << amount) & line
+        x |= (x << amount) & line
+        x |= (x << amount) & line
+        moves |= x << amount
+        x = (own >> amount) & line
+        x |= (x >> amount) & line
+        x |= (x >> amount) & line
+        x |= (x >> amount) & line
+        x |= (x >> amount) & line
+        x |= (x >> amount) & line
+        moves |= x >> amount
+    return moves & empty
+
+
+# flip_mask() is generated below with one copy of this block per direction, so that the shift is a constant and there
+# is no loop over directions. Moving along a direction shifts by dr * 8 + dc: left for positive amounts, right for
+# negative ones. Sideways and diagonal lines only run through opposing discs off the edge columns ("inner"), so they
+# stop at the edge instead of wrapping around to the next row. Bits shifted past either end fall off the board.
+FLIP_DIRECTION_TEMPLATE = """
+    # Direction ({dr}, {dc})
+    x = (bit {op} {amount}) & {line}
+    if x:
+        flipped = x
+        x {op}= {amount}
+        while x & {line}:
+            flipped |= x
+            x {op}= {amount}
+        if x & own:  # The line of opposing discs is closed off by a friendly one
+            result |= flipped
+"""
+
+FLIP_MASK_SOURCE = (
+    'def flip_mask(own, opp, bit):\n'
+    '    inner = opp & NOT_COL_0 & NOT_COL_7\n'
+    '    result = 0\n'
+    + ''.join(
+        FLIP_DIRECTION_TEMPLATE.format(dr=dr, dc=dc, op='<<' if dr * 8 + dc > 0 else '>>', amount=abs(dr * 8 + dc),
+                                       line='opp' if dc == 0 else 'inner')
+        for dr, dc in DIRECTIONS
+    )
+    + '    return result\n'
+)
+exec(compile(FLIP_MASK_SOURCE, '<flip_mask>', 'exec'))
+flip_mask.__doc__ = """
+    :param own: Bitboard of the side to move
+    :param opp: Bitboard of its opponent
+    :param bit: Bitboard with only the square being played set
+    :return: Bitboard of the opponent's discs that playing bit would flip
+    """
+
+
+if hasattr(int, 'bit_count'):
+    popcount = int.bit_count  # Python 3.10+
+else:
+    def popcount(bits):
+        return bin(bits).count('1')
+
+
+def score_bb(own, opp):
+    """
+    :param own: Bitboard of the side to move
+    :param opp: Bitboard of its opponent
+    :return: How many more discs own has than opp
+    """
+    return popcount(own) - popcount(opp)
+
+
+def mobility_bb(own, opp):
+    """
+    :param own: Bitboard of the side to move
+    :param opp: Bitboard of its opponent
+    :return: How many legal moves own has
+    """
+    return popcount(move_mask(own, opp))
+
+
+# Static value of holding each square (index r * 8 + c): corners are strongest, edges next, and the squares next to a
+# corner (the "X" and "C" squares) are weakest since they tend to hand that corner to the opponent.
+POSITION_WEIGHTS = (
+    100, -20, 10, 5, 5, 10, -20, 100,
+    -20, -50, -2, -2, -2, -2, -50, -20,
+    10, -2, -1, -1, -1, -1, -2, 10,
+    5, -2, -1, -1, -1, -1, -2, 5,
+    5, -2, -1, -1, -1, -1, -2, 5,
+    10, -2, -1, -1, -1, -1, -2, 10,
+    -20, -50, -2, -2, -2, -2, -50, -20,
+    100, -20, 10, 5, 5, 10, -20, 100,
+)
+
+# POSITION_WEIGHTS as (weight, bitboard of the squares with that weight) pairs, best first
+WEIGHT_GROUPS = tuple(
+    (weight, sum(1 << i for i in range(64) if POSITION_WEIGHTS[i] == weight))
+    for weight in sorted(set(POSITION_WEIGHTS), reverse=True)
+)
+
+# Searching strong moves first lets alpha-beta cut off the rest sooner
+MOVE_ORDER = tuple(squares for _, squares in WEIGHT_GROUPS)
+
+CORNERS = sum(1 << i for i in (0, 7, 56, 63))
+
+CORNER_WEIGHT = 100  # On top of POSITION_WEIGHTS: corners can never be flipped back
+MOBILITY_WEIGHT = 5  # Value of each extra legal move
+FINAL_SCORE_WEIGHT = 10000  # Scales the disc difference of a finished game above any heuristic value
+
+
+def evaluate_bb(own, opp):
+    """
+    :param own: Bitboard of the side to move
+    :param opp: Bitboard of its opponent
+    :return: Heuristic value of the position for own: the POSITION_WEIGHTS of own's squares minus those of opp's, plus
+    bonuses for holding more corners and having more moves than the opponent. A finished game is worth its disc
+    difference times FINAL_SCORE_WEIGHT, so a win beats anything else.
+    """
+    own_moves = mobility_bb(own, opp)
+    opp_moves = mobility_bb(opp, own)
+    if not own_moves and not opp_moves:
+        return FINAL_SCORE_WEIGHT * score_bb(own, opp)
+    value = CORNER_WEIGHT * score_bb(own & CORNERS, opp & CORNERS) + MOBILITY_WEIGHT * (own_moves - opp_moves)
+    for weight, squares in WEIGHT_GROUPS:
+        value += weight * score_bb(own & squares, opp & squares)
+    return value
+
+
+# Zobrist keys: one random 64-bit number per (square, colour) plus one for "O to move". A position's hash is the XOR
+# of the keys of its discs, so playing a move only needs the keys of the squares that changed.
+_zobrist_random = random.Random(20240229)  # Fixed seed so hashes are reproducible between runs
+Z_X = tuple(_zobrist_random.getrandbits(64) for _ in range(64))
+Z_O = tuple(_zobrist_random.getrandbits(64) for _ in range(64))
+Z_SIDE = _zobrist_random.getrandbits(64)
+Z_FLIP = {1 << i: Z_X[i] ^ Z_O[i] for i in range(64)}  # Keyed by bit: turns a disc on square i over
+
+
+def zobrist_hash(own, opp, player):
+    """
+    :param own: Bitboard of the side to move
+    :param opp: Bitboard of its opponent
+    :param player: 'X' or 'O', the side to move
+    :return: The Zobrist hash of the position
+    """
+    own_keys, opp_keys = (Z_X, Z_O) if player == 'X' else (Z_O, Z_X)
+    key = Z_SIDE if player == 'O' else 0
+    for i in range(64):
+        if own >> i & 1:
+            key ^= own_keys[i]
+        elif opp >> i & 1:
+            key ^= opp_keys[i]
+    return key
+
+
+# Transposition table: a fixed number of slots indexed by the low bits of the Zobrist hash. Each slot holds
+# (key, depth, value, flag, best) for the last position stored there (always-replace), where best is the bit of the
+# move that produced value. Even when the stored depth is too shallow to reuse value, best is tried first.
+TT_SIZE = 1 << 18
+TT = [None] * TT_SIZE
+EXACT, LOWER, UPPER = 0, 1, 2
+
+# Set when the game quits, so a search still running on a worker thread gives up instead of holding up the exit
+SEARCH_ABORT = threading.Event()
+
+
+class SearchAborted(Exception):
+    pass
 
 
 Board = Sequence[str]
@@ -116,40 +360,90 @@ Move = Tuple[int, int]
 MoveResult = Union[str, Move, None]
 
 
-def value(board: Board, player: Player, depth: int) -> int:
+def negamax(own: int, opp: int, player: Player, depth: int, alpha: float = -float('inf'),
+            beta: float = float('inf'), key: Optional[int] = None) -> float:
     """
-    :param board: A sequence of strings
-    :param player: 'X' or 'O'
+    :param own: Bitboard of the side to move
+    :param opp: Bitboard of its opponent
+    :param player: 'X' or 'O', the side to move
     :param depth: At least 1; greater depth is slower but smarter
-    :return: The value of board if it is player's turn
+    :param alpha: Lower bound of the search window, from player's point of view
+    :param beta: Upper bound of the search window, from player's point of view
+    :param key: The Zobrist hash of the position; computed from scratch if omitted
+    :return: The value of the position for player (positive is good for player).
+    Exact when it lies strictly inside (alpha, beta), otherwise only a bound on the true value.
     """
-    #Returns value of total flips for your best move and then other players best move. Positive value is net gain for you: negative value is net loss for you
-
     if depth == 0:
-        return score(board)
+        return evaluate_bb(own, opp)
+    if SEARCH_ABORT.is_set():
+        raise SearchAborted
+
+    if key is None:
+        key = zobrist_hash(own, opp, player)
+    slot = key & (TT_SIZE - 1)
+    entry = TT[slot]
+    if entry is not None and entry[0] != key:
+        entry = None
+    if entry is not None and entry[1] >= depth:
+        _, _, stored, flag, _ = entry
+        if flag == EXACT:
+            return stored
+        if flag == LOWER:
+            alpha = max(alpha, stored)
+        else:
+            beta = min(beta, stored)
+        if alpha >= beta:
+            return stored
 
-    moves = legal_moves(board, player)
+    moves = move_mask(own, opp)
     if not moves:
-        return score(board)
-    if moves == ['pass']:
-        return value(board, opposite(player), max(depth - 1, 0))
-
-    if player == 'X':
-        best_value = -float('inf')
-        for move in moves:
-            test_board = successor(board, player, move)
-            val = value(test_board, opposite(player), depth - 1)
-            if best_value < val:
-                best_value = val
-        return best_value
-
-    # player == 'O'
-    best_value = float('inf')
-    for move in moves:
-        test_board = successor(board, player, move)
-        val = value(test_board, opposite(player), depth - 1)
-        if best_value > val:
+        if not move_mask(opp, own):
+            return FINAL_SCORE_WEIGHT * score_bb(own, opp)  # Neither side can move -- game over
+        return -negamax(opp, own, OPPONENT[player], max(depth - 1, 0), -beta, -alpha, key ^ Z_SIDE)
+
+    own_keys = Z_X if player == 'X' else Z_O
+    # The move that was best last time this position was searched, then the rest by MOVE_ORDER
+    ordered = []
+    hash_move = entry[4] & moves if entry is not None else 0
+    if hash_move:
+        ordered.append(hash_move)
+        moves ^= hash_move
+    for group in MOVE_ORDER:
+        group &= moves
+        while group:
+            bit = group & -group
+            ordered.append(bit)
+            group ^= bit
+
+    alpha_orig = alpha
+    best_value = -float('inf')
+    best_bit = 0
+    for bit in ordered:
+        flipped = flip_mask(own, opp, bit)
+        if depth == 1:
+            val = -evaluate_bb(opp ^ flipped, own | bit | flipped)  # Score leaves here rather than recursing into them
+        else:
+            child_key = key ^ Z_SIDE ^ own_keys[bit.bit_length() - 1]
+            f = flipped
+            while f:
+                low = f & -f
+                child_key ^= Z_FLIP[low]
+                f ^= low
+            val = -negamax(opp ^ flipped, own | bit | flipped, OPPONENT[player], depth - 1, -beta, -alpha, child_key)
+        if best_value < val:
             best_value = val
+            best_bit = bit
+        alpha = max(alpha, best_value)
+        if alpha >= beta:
+            break  # The opponent already has a better option elsewhere -- prune the remaining moves
+
+    if best_value <= alpha_orig:
+        flag = UPPER
+    elif best_value >= beta:
+        flag = LOWER
+    else:
+        flag = EXACT
+    TT[slot] = (key, depth, best_value, flag, best_bit)
     return best_value
 
 
@@ -175,23 +469,32 @@ def best_move(board: Board, player: Player, depth: int) -> MoveResult:
     if moves == ['pass']:
         return 'pass'
 
-    if player == 'X':
-        best_play = None
+    # Entries left by earlier searches may be deeper than this one asks for; reusing them would make the result
+    # depend on what was searched before. Iterative deepening below still shares the table between its iterations.
+    TT[:] = [None] * TT_SIZE
+    own, opp = to_bitboards(board, player)
+    other = OPPONENT[player]
+    # The positions after each root move don't change between iterations, so play them out just once
+    children = []
+    for move in sorted(moves, key=lambda move: -POSITION_WEIGHTS[move[0] * 8 + move[1]]):
+        r, c = move
+        bit = 1 << (r * 8 + c)
+        flipped = flip_mask(own, opp, bit)
+        child_own, child_opp = opp ^ flipped, own | bit | flipped
+        children.append((move, child_own, child_opp, zobrist_hash(child_own, child_opp, other)))
+
+    best_play = None
+    # Iterative deepening: each shallower search leaves best moves in the transposition table (and best_play here)
+    # that the next, deeper one tries first, which lets alpha-beta prune far more of the tree.
+    for d in range(1, depth + 1):
+        if best_play is not None:
+            children.sort(key=lambda child: child[0] != best_play)
         best_value = -float('inf')
-        for move in moves:
-            val = value(successor(board, player, move), opposite(player), depth - 1)
+        for move, child_own, child_opp, child_key in children:
+            val = -negamax(child_own, child_opp, other, d - 1, -float('inf'), -best_value, child_key)
             if best_value < val:
                 best_value = val
                 best_play = move
-        return best_play
-
-    best_play = None
-    best_value = float('inf')
-    for move in moves:
-        val = value(successor(board, player, move), opposite(player), depth - 1)
-        if best_value > val:
-            best_value = val
-            best_play = move
     return best_play
 
 
@@ -260,6 +563,11 @@ TEXT_PRIMARY = (240, 244, 255)
 TEXT_SECONDARY = (164, 174, 193)
 STATUS_BG = (22, 25, 41)
 
+# Frame rates for the UI loops: the full rate while something on screen is changing, a lower one while it sits still
+ACTIVE_FPS = 60
+IDLE_FPS = 30
+IDLE_WAIT_MS = 1000  # Longest the game screen sleeps waiting for the human before checking its state again
+
 DIFFICULTIES = [
     ("Easy", 1, "Depth 1 · Quick replies"),
     ("Medium", 2, "Depth 2 · Casual play"),
@@ -269,6 +577,17 @@ DIFFICULTIES = [
 HUMAN_PLAYER: Player = 'X'
 AI_PLAYER: Player = 'O'
 
+# The AI searches on this worker thread so the UI keeps handling events and drawing while it thinks
+AI_POOL = ThreadPoolExecutor(max_workers=1)
+
+
+def quit_game() -> None:
+    """Closes the window and exits, stopping any AI search rather than waiting for it to finish."""
+    SEARCH_ABORT.set()
+    AI_POOL.shutdown(wait=False, cancel_futures=True)
+    pygame.quit()
+    sys.exit()
+
 
 def count_pieces(board: Board) -> Tuple[int, int]:
     x_count = sum(row.count('X') for row in board)
@@ -276,8 +595,15 @@ def count_pieces(board: Board) -> Tuple[int, int]:
     return x_count, o_count
 
 
+@functools.lru_cache(maxsize=4)
+def cached_count_pieces(board: Tuple[str, ...]) -> Tuple[int, int]:
+    """count_pieces() for tuple boards, remembered so the final board is counted once for both the result and
+    determine_winner(). draw_board() only runs when the frame changes, so it rarely sees the same board twice."""
+    return count_pieces(board)
+
+
 def determine_winner(board: Board) -> str:
-    x_score, o_score = count_pieces(board)
+    x_score, o_score = cached_count_pieces(board)
     if x_score > o_score:
         return "human"
     if o_score > x_score:
@@ -302,72 +628,149 @@ def board_position_from_mouse(pos: Tuple[int, int]) -> Optional[Move]:
     return int(row), int(col)
 
 
-def light_gradient(surface: pygame.Surface) -> None:
-    """Draw a subtle vertical gradient as the background."""
+_gradient_surface: Optional[pygame.Surface] = None
+
+
+def render_gradient(size: Tuple[int, int]) -> pygame.Surface:
+    """Render the vertical background gradient once into a surface of the given size."""
+    width, height = size
+    gradient = pygame.Surface(size).convert()
     top_color = GRADIENT_TOP
     bottom_color = GRADIENT_BOTTOM
-    for y in range(WINDOW_HEIGHT):
-        ratio = y / WINDOW_HEIGHT
+    for y in range(height):
+        ratio = y / height
         r = int(top_color[0] * (1 - ratio) + bottom_color[0] * ratio)
         g = int(top_color[1] * (1 - ratio) + bottom_color[1] * ratio)
         b = int(top_color[2] * (1 - ratio) + bottom_color[2] * ratio)
-        pygame.draw.line(surface, (r, g, b), (0, y), (WINDOW_WIDTH, y))
+        pygame.draw.line(gradient, (r, g, b), (0, y), (width, y))
+    return gradient
+
+
+def light_gradient(surface: pygame.Surface) -> None:
+    """Draw a subtle vertical gradient as the background."""
+    global _gradient_surface
+    # The gradient never changes, so it is only re-rendered if the window size does
+    if _gradient_surface is None or _gradient_surface.get_size() != surface.get_size():
+        _gradient_surface = render_gradient(surface.get_size())
+    surface.blit(_gradient_surface, (0, 0))
+
+
+@functools.lru_cache(maxsize=256)
+def render_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render antialiased text, reusing the surface from an earlier frame when nothing about it has changed."""
+    return font.render(text, True, color)
+
+
+@functools.lru_cache(maxsize=None)
+def disc_surface(color: Tuple[int, int, int], accent: Tuple[int, int, int], radius: int) -> pygame.Surface:
+    """Render a disc once onto a transparent surface of size 2 * radius + 2, centred at (radius + 1, radius + 1)."""
+    disc = pygame.Surface((2 * radius + 2, 2 * radius + 2), pygame.SRCALPHA).convert_alpha()
+    center = (radius + 1, radius + 1)
+    pygame.draw.circle(disc, color, center, radius)
+    pygame.draw.circle(disc, accent, center, radius - max(2, radius // 6))
+    return disc
 
 
 def draw_disc(surface: pygame.Surface, center: Tuple[int, int], color: Tuple[int, int, int], accent: Tuple[int, int, int], radius: int) -> None:
-    pygame.draw.circle(surface, color, center, radius)
-    pygame.draw.circle(surface, accent, center, radius - max(2, radius // 6))
+    surface.blit(disc_surface(color, accent, radius), (center[0] - radius - 1, center[1] - radius - 1))
 
 
-def draw_board(surface: pygame.Surface, board: Board, highlight_moves: List[Move], last_move: Optional[Move],
-               current_player: Player, difficulty_label: str, status_message: str, fonts: dict) -> None:
-    light_gradient(surface)
+@functools.lru_cache(maxsize=None)
+def hint_surface(size: int) -> pygame.Surface:
+    """Render the legal-move marker once for squares of the given size."""
+    hint = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+    pygame.draw.circle(hint, HINT_COLOR, (size // 2, size // 2), size // 6)
+    return hint
+
+
+def square_rect(r: int, c: int) -> pygame.Rect:
+    return pygame.Rect(BOARD_LEFT + c * SQUARE_SIZE, BOARD_TOP + r * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+
+
+def info_panel_rect() -> pygame.Rect:
+    return pygame.Rect(BOARD_LEFT + BOARD_SIZE + 32, BOARD_TOP, 220, 320)
+
+
+def status_bar_rect() -> pygame.Rect:
+    return pygame.Rect(BOARD_LEFT - 14, BOARD_TOP + BOARD_SIZE + 24, BOARD_SIZE + 28, 64)
+
+
+def board_dirty_rects(previous: tuple, current: tuple) -> List[pygame.Rect]:
+    """
+    :param previous: The last frame drawn, as (board, highlight_moves, last_move, current_player, status_message)
+    :param current: The frame just drawn, in the same form
+    :return: The areas of the screen that differ between the two frames
+    """
+    old_board, old_hints, old_last_move, old_player, old_status = previous
+    board, hints, last_move, player, status = current
+
+    squares = {(r, c) for r in range(8) for c in range(8) if old_board[r][c] != board[r][c]}
+    squares.update(set(old_hints) ^ set(hints))
+    if old_last_move != last_move:
+        squares.update(move for move in (old_last_move, last_move) if move)
+    rects = [square_rect(r, c) for r, c in squares]
+
+    if old_board != board or old_player != player:
+        rects.append(info_panel_rect())  # Scores and turn
+    if old_status != status:
+        rects.append(status_bar_rect())
+    return rects
+
+
+_board_background: Optional[pygame.Surface] = None
+
+
+def render_board_background(size: Tuple[int, int]) -> pygame.Surface:
+    """Render the static part of the game screen: the background gradient, the board frame and the grid."""
+    background = render_gradient(size)
 
     frame_rect = pygame.Rect(BOARD_LEFT - 14, BOARD_TOP - 14, BOARD_SIZE + 28, BOARD_SIZE + 28)
     inner_frame_rect = frame_rect.inflate(-10, -10)
     board_rect = pygame.Rect(BOARD_LEFT, BOARD_TOP, BOARD_SIZE, BOARD_SIZE)
 
-    pygame.draw.rect(surface, BOARD_FRAME_OUTER, frame_rect, border_radius=24)
-    pygame.draw.rect(surface, BOARD_FRAME_INNER, inner_frame_rect, border_radius=20)
-    pygame.draw.rect(surface, BOARD_COLOR, board_rect, border_radius=16)
+    pygame.draw.rect(background, BOARD_FRAME_OUTER, frame_rect, border_radius=24)
+    pygame.draw.rect(background, BOARD_FRAME_INNER, inner_frame_rect, border_radius=20)
+    pygame.draw.rect(background, BOARD_COLOR, board_rect, border_radius=16)
 
     # Grid lines
     for i in range(1, 8):
         y = BOARD_TOP + i * SQUARE_SIZE
         x = BOARD_LEFT + i * SQUARE_SIZE
-        pygame.draw.line(surface, GRID_COLOR, (BOARD_LEFT, y), (BOARD_LEFT + BOARD_SIZE, y), 2)
-        pygame.draw.line(surface, GRID_COLOR, (x, BOARD_TOP), (x, BOARD_TOP + BOARD_SIZE), 2)
+        pygame.draw.line(background, GRID_COLOR, (BOARD_LEFT, y), (BOARD_LEFT + BOARD_SIZE, y), 2)
+        pygame.draw.line(background, GRID_COLOR, (x, BOARD_TOP), (x, BOARD_TOP + BOARD_SIZE), 2)
+    return background
+
+
+def draw_board(surface: pygame.Surface, board: Board, highlight_moves: List[Move], last_move: Optional[Move],
+               current_player: Player, difficulty_label: str, status_message: str, fonts: dict) -> None:
+    global _board_background
+    # Everything up to the grid is the same on every frame, so it comes from one cached surface
+    if _board_background is None or _board_background.get_size() != surface.get_size():
+        _board_background = render_board_background(surface.get_size())
+    surface.blit(_board_background, (0, 0))
 
     # Highlight last move
     if last_move:
-        r, c = last_move
-        move_rect = pygame.Rect(
-            BOARD_LEFT + c * SQUARE_SIZE,
-            BOARD_TOP + r * SQUARE_SIZE,
-            SQUARE_SIZE,
-            SQUARE_SIZE
-        )
+        move_rect = square_rect(*last_move)
         pygame.draw.rect(surface, LAST_MOVE_COLOR, move_rect.inflate(-SQUARE_SIZE // 3, -SQUARE_SIZE // 3), width=3, border_radius=8)
 
     # Hint markers
-    hint_surface = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA)
-    pygame.draw.circle(hint_surface, HINT_COLOR, (SQUARE_SIZE // 2, SQUARE_SIZE // 2), SQUARE_SIZE // 6)
+    hint = hint_surface(SQUARE_SIZE)
     for r, c in highlight_moves:
-        surface.blit(hint_surface, (BOARD_LEFT + c * SQUARE_SIZE, BOARD_TOP + r * SQUARE_SIZE))
+        surface.blit(hint, (BOARD_LEFT + c * SQUARE_SIZE, BOARD_TOP + r * SQUARE_SIZE))
 
     # Pieces
     radius = SQUARE_SIZE // 2 - 6
+    black = disc_surface(BLACK_DISC, BLACK_DISC_HILITE, radius)
+    white = disc_surface(WHITE_DISC, WHITE_DISC_SHADOW, radius)
+    offset = SQUARE_SIZE // 2 - radius - 1  # From the corner of a square to the corner of its disc surface
     for r in range(8):
         for c in range(8):
             piece = board[r][c]
             if piece == '.':
                 continue
-            center = (BOARD_LEFT + c * SQUARE_SIZE + SQUARE_SIZE // 2,
-                      BOARD_TOP + r * SQUARE_SIZE + SQUARE_SIZE // 2)
-            if piece == 'X':
-                draw_disc(surface, center, BLACK_DISC, BLACK_DISC_HILITE, radius)
-            else:
-                draw_disc(surface, center, WHITE_DISC, WHITE_DISC_SHADOW, radius)
+            surface.blit(black if piece == 'X' else white,
+                         (BOARD_LEFT + c * SQUARE_SIZE + offset, BOARD_TOP + r * SQUARE_SIZE + offset))
 
     if last_move:
         r, c = last_move
@@ -377,22 +780,22 @@ def draw_board(surface: pygame.Surface, board: Board, highlight_moves: List[Move
         pygame.draw.circle(surface, LAST_MOVE_DOT_COLOR, center, dot_radius)
 
     # Info panel
-    panel_rect = pygame.Rect(BOARD_LEFT + BOARD_SIZE + 32, BOARD_TOP, 220, 320)
+    panel_rect = info_panel_rect()
     pygame.draw.rect(surface, PANEL_BG, panel_rect, border_radius=20)
     pygame.draw.rect(surface, PANEL_BORDER, panel_rect, width=2, border_radius=20)
 
-    title = fonts["panel_title"].render("Match Info", True, TEXT_PRIMARY)
+    title = render_text(fonts["panel_title"], "Match Info", TEXT_PRIMARY)
     surface.blit(title, (panel_rect.x + 20, panel_rect.y + 20))
 
-    difficulty_text = fonts["body"].render(f"Difficulty: {difficulty_label}", True, TEXT_SECONDARY)
+    difficulty_text = render_text(fonts["body"], f"Difficulty: {difficulty_label}", TEXT_SECONDARY)
     surface.blit(difficulty_text, (panel_rect.x + 20, panel_rect.y + 70))
 
-    current_text = fonts["body"].render(f"Turn: {player_label(current_player)}", True, TEXT_SECONDARY)
+    current_text = render_text(fonts["body"], f"Turn: {player_label(current_player)}", TEXT_SECONDARY)
     surface.blit(current_text, (panel_rect.x + 20, panel_rect.y + 110))
 
     # Scores
-    x_score, o_score = count_pieces(board)
-    score_title = fonts["panel_title"].render("Score", True, TEXT_PRIMARY)
+    x_score, o_score = cached_count_pieces(board)
+    score_title = render_text(fonts["panel_title"], "Score", TEXT_PRIMARY)
     surface.blit(score_title, (panel_rect.x + 20, panel_rect.y + 160))
 
     disc_radius = 18
@@ -403,22 +806,22 @@ def draw_board(surface: pygame.Surface, board: Board, highlight_moves: List[Move
     for row_y, fill, accent, tally, label in score_rows:
         center = (panel_rect.x + 38, row_y)
         draw_disc(surface, center, fill, accent, disc_radius)
-        text_surface = fonts["body"].render(f"{tally:>2} · {label}", True, TEXT_SECONDARY)
+        text_surface = render_text(fonts["body"], f"{tally:>2} · {label}", TEXT_SECONDARY)
         text_pos = (panel_rect.x + 80, row_y - text_surface.get_height() // 2 - 2)
         surface.blit(text_surface, text_pos)
 
-    hint_text = fonts["small"].render("Click a highlighted square to play.", True, TEXT_SECONDARY)
+    hint_text = render_text(fonts["small"], "Click a highlighted square to play.", TEXT_SECONDARY)
     hint_rect = hint_text.get_rect()
     hint_rect.left = panel_rect.x + 20
     hint_rect.bottom = panel_rect.bottom - 16
     surface.blit(hint_text, hint_rect)
 
     # Status bar
-    status_rect = pygame.Rect(BOARD_LEFT - 14, BOARD_TOP + BOARD_SIZE + 24, BOARD_SIZE + 28, 64)
+    status_rect = status_bar_rect()
     pygame.draw.rect(surface, STATUS_BG, status_rect, border_radius=16)
     pygame.draw.rect(surface, PANEL_BORDER, status_rect, width=2, border_radius=16)
 
-    status_surface = fonts["status"].render(status_message, True, TEXT_PRIMARY)
+    status_surface = render_text(fonts["status"], status_message, TEXT_PRIMARY)
     status_pos = status_surface.get_rect(center=status_rect.center)
     surface.blit(status_surface, status_pos)
 
@@ -436,66 +839,75 @@ def show_start_screen(screen: pygame.Surface, clock: pygame.time.Clock, fonts: d
         card_height
     )
     button_top = card_rect.y + 180
+    button_rects = [
+        pygame.Rect(
+            card_rect.x + (card_width - button_width) // 2,
+            button_top + index * (button_height + button_margin),
+            button_width,
+            button_height
+        )
+        for index in range(len(DIFFICULTIES))
+    ]
 
+    # Only hovering changes this screen: redraw when the hovered button does, and send just those buttons to the display
+    full_redraw = True
+    drawn_hover: Optional[int] = None
+    idle = False
     while True:
-        clock.tick(60)
+        clock.tick(IDLE_FPS if idle else ACTIVE_FPS)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                quit_game()
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
+                quit_game()
+            if event.type == pygame.VIDEOEXPOSE:
+                full_redraw = True
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                mouse_pos = event.pos
-                for index, (label, depth, description) in enumerate(DIFFICULTIES):
-                    rect = pygame.Rect(
-                        card_rect.x + (card_width - button_width) // 2,
-                        button_top + index * (button_height + button_margin),
-                        button_width,
-                        button_height
-                    )
-                    if rect.collidepoint(mouse_pos):
+                for (label, depth, description), rect in zip(DIFFICULTIES, button_rects):
+                    if rect.collidepoint(event.pos):
                         return depth, label
 
+        mouse_pos = pygame.mouse.get_pos()
+        hovered = next((index for index, rect in enumerate(button_rects) if rect.collidepoint(mouse_pos)), None)
+        idle = not full_redraw and hovered == drawn_hover
+        if idle:
+            continue
+
         light_gradient(screen)
 
         #Card background
         pygame.draw.rect(screen, PANEL_BG, card_rect, border_radius=26)
         pygame.draw.rect(screen, PANEL_BORDER, card_rect, width=2, border_radius=26)
 
-        title_surface = fonts["title"].render("Othello AI", True, TEXT_PRIMARY)
-        subtitle_surface = fonts["subtitle"].render("Choose your challenge level", True, TEXT_SECONDARY)
+        title_surface = render_text(fonts["title"], "Othello AI", TEXT_PRIMARY)
+        subtitle_surface = render_text(fonts["subtitle"], "Choose your challenge level", TEXT_SECONDARY)
         screen.blit(title_surface, title_surface.get_rect(center=(WINDOW_WIDTH // 2, card_rect.y + 60)))
         screen.blit(subtitle_surface, subtitle_surface.get_rect(center=(WINDOW_WIDTH // 2, card_rect.y + 110)))
-        turn_surface = fonts["small"].render("You play as black and make the first move.", True, TEXT_SECONDARY)
+        turn_surface = render_text(fonts["small"], "You play as black and make the first move.", TEXT_SECONDARY)
         screen.blit(turn_surface, turn_surface.get_rect(center=(WINDOW_WIDTH // 2, card_rect.y + 140)))
 
-        mouse_pos = pygame.mouse.get_pos()
-        for index, (label, depth, description) in enumerate(DIFFICULTIES):
-            rect = pygame.Rect(
-                card_rect.x + (card_width - button_width) // 2,
-                button_top + index * (button_height + button_margin),
-                button_width,
-                button_height
-            )
-            hovered = rect.collidepoint(mouse_pos)
-            color = (64, 140, 96) if hovered else (47, 108, 74)
+        for index, ((label, depth, description), rect) in enumerate(zip(DIFFICULTIES, button_rects)):
+            color = (64, 140, 96) if index == hovered else (47, 108, 74)
             pygame.draw.rect(screen, color, rect, border_radius=18)
             pygame.draw.rect(screen, PANEL_BORDER, rect, width=2, border_radius=18)
 
-            label_surface = fonts["button"].render(label, True, TEXT_PRIMARY)
-            desc_surface = fonts["small"].render(description, True, TEXT_SECONDARY)
+            label_surface = render_text(fonts["button"], label, TEXT_PRIMARY)
+            desc_surface = render_text(fonts["small"], description, TEXT_SECONDARY)
             screen.blit(label_surface, label_surface.get_rect(center=(rect.centerx, rect.y + 24)))
             screen.blit(desc_surface, desc_surface.get_rect(center=(rect.centerx, rect.y + 50)))
 
-        esc_surface = fonts["tiny"].render("Press Esc to exit", True, TEXT_SECONDARY)
+        esc_surface = render_text(fonts["tiny"], "Press Esc to exit", TEXT_SECONDARY)
         screen.blit(esc_surface, esc_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 60)))
 
-        credit_surface = fonts["tiny"].render("Inspired by https://www.eothello.com/ - Created by Panagiotis", True, TEXT_SECONDARY)
+        credit_surface = render_text(fonts["tiny"], "Inspired by https://www.eothello.com/ - Created by Panagiotis", TEXT_SECONDARY)
         screen.blit(credit_surface, credit_surface.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 24)))
 
-        pygame.display.flip()
+        if full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update([button_rects[index] for index in (drawn_hover, hovered) if index is not None])
+        full_redraw = False
+        drawn_hover = hovered
 
 
 def play_match(screen: pygame.Surface, clock: pygame.time.Clock, depth: int, difficulty_label: str, fonts: dict) -> dict:
@@ -503,23 +915,41 @@ def play_match(screen: pygame.Surface, clock: pygame.time.Clock, depth: int, dif
     current_player: Player = HUMAN_PLAYER
     last_move: Optional[Move] = None
     passes_in_a_row = 0
-    ai_pending_move: Optional[Move] = None
+    ai_search: Optional[Future] = None
     ai_execute_at = 0
     status_message = "You have the first move."
     message_expires = pygame.time.get_ticks() + 1500
+    drawn_frame: Optional[tuple] = None  # What is currently on the display; None forces a full redraw
+    idle = False
+    waited_events: List[pygame.event.Event] = []  # Taken off the queue while sleeping, handled before any newer ones
 
     while True:
-        clock.tick(60)
+        # The frame on screen is only known to be current if it was drawn for the human's turn and nothing has
+        # changed since. After an AI move or a pass, idle can still be left over from the frames before it.
+        if idle and current_player == HUMAN_PLAYER and drawn_frame is not None and drawn_frame[3] == HUMAN_PLAYER:
+            # Only the human can change the screen now: sleep until an event arrives or the status message is due to
+            # expire
+            now = pygame.time.get_ticks()
+            timeout = message_expires - now + 1 if message_expires >= now else IDLE_WAIT_MS
+            event = pygame.event.wait(min(timeout, IDLE_WAIT_MS))
+            if event.type != pygame.NOEVENT:
+                waited_events.append(event)
+        else:
+            clock.tick(IDLE_FPS if idle else ACTIVE_FPS)
         current_time = pygame.time.get_ticks()
 
         if current_time > message_expires:
-            status_message = "Your turn" if current_player == HUMAN_PLAYER else "AI thinking..."
+            if current_player == HUMAN_PLAYER:
+                status_message = "Your turn"
+            else:
+                status_message = "AI thinking" + "." * (1 + current_time // 400 % 3)
 
-        valid_moves = legal_moves(board, current_player)
+        valid_flips = legal_move_flips(board, current_player)
+        valid_moves = [move for move, _ in valid_flips]
         if not valid_moves:
             passes_in_a_row += 1
             if passes_in_a_row >= 2:
-                x_score, o_score = count_pieces(board)
+                x_score, o_score = cached_count_pieces(board)
                 outcome = determine_winner(board)
                 return {
                     "board": board,
@@ -531,7 +961,7 @@ def play_match(screen: pygame.Surface, clock: pygame.time.Clock, depth: int, dif
             status_message = f"{player_label(current_player)} has no moves and passes."
             message_expires = current_time + 2000
             current_player = opposite(current_player)
-            ai_pending_move = None
+            ai_search = None
             ai_execute_at = current_time + 350 if current_player == AI_PLAYER else 0
             continue
 
@@ -540,7 +970,7 @@ def play_match(screen: pygame.Surface, clock: pygame.time.Clock, depth: int, dif
             status_message = f"{player_label(current_player)} passes."
             message_expires = current_time + 2000
             current_player = opposite(current_player)
-            ai_pending_move = None
+            ai_search = None
             ai_execute_at = current_time + 350 if current_player == AI_PLAYER else 0
             continue
 
@@ -548,22 +978,23 @@ def play_match(screen: pygame.Surface, clock: pygame.time.Clock, depth: int, dif
         human_turn = current_player == HUMAN_PLAYER
 
         move_made = False
-        for event in pygame.event.get():
+        events, waited_events = waited_events + pygame.event.get(), []
+        for event in events:
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                quit_game()
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                pygame.quit()
-                sys.exit()
+                quit_game()
+            if event.type == pygame.VIDEOEXPOSE:
+                drawn_frame = None
             if human_turn and event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 candidate = board_position_from_mouse(event.pos)
                 if candidate and candidate in valid_moves:
-                    board = successor(board, current_player, candidate)
+                    board = apply_move(board, current_player, candidate, dict(valid_flips)[candidate])
                     last_move = candidate
                     current_player = opposite(current_player)
                     status_message = "AI thinking..."
                     message_expires = current_time + 1500
-                    ai_pending_move = None
+                    ai_search = None
                     ai_execute_at = current_time + 350
                     move_made = True
                     break
@@ -571,29 +1002,31 @@ def play_match(screen: pygame.Surface, clock: pygame.time.Clock, depth: int, dif
             continue
 
         if current_player == AI_PLAYER:
-            if ai_pending_move is None:
-                ai_pending_move = best_move(board, current_player, depth)
-                if ai_pending_move is None or ai_pending_move == 'pass':
+            if ai_search is None:
+                ai_search = AI_POOL.submit(best_move, board, current_player, depth)
+                ai_execute_at = current_time + 400  # Even a quick reply is held back this long
+            elif ai_search.done() and current_time >= ai_execute_at:
+                ai_move = ai_search.result()
+                ai_search = None
+                if ai_move is None or ai_move == 'pass':
                     passes_in_a_row += 1
                     status_message = "AI passes."
                     message_expires = current_time + 2000
                     current_player = HUMAN_PLAYER
-                    ai_pending_move = None
                     continue
-                ai_execute_at = current_time + 400
-                status_message = "AI thinking..."
-                message_expires = current_time + 1500
-            elif current_time >= ai_execute_at:
-                board = successor(board, current_player, ai_pending_move)
-                last_move = ai_pending_move
+                board = successor(board, current_player, ai_move)
+                last_move = ai_move
                 current_player = opposite(current_player)
-                ai_pending_move = None
                 status_message = "Your turn"
                 message_expires = current_time + 1200
                 continue
 
-        #Draw frame
+        #Draw frame, but only if it would differ from the one on screen
         highlight_moves = valid_moves if human_turn else []
+        frame = (board, highlight_moves, last_move, current_player, status_message)
+        idle = frame == drawn_frame
+        if idle:
+            continue
         draw_board(
             screen,
             board,
@@ -604,7 +1037,11 @@ def play_match(screen: pygame.Surface, clock: pygame.time.Clock, depth: int, dif
             status_message,
             fonts
         )
-        pygame.display.flip()
+        if drawn_frame is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(board_dirty_rects(drawn_frame, frame))
+        drawn_frame = frame
 
 
 def show_game_over(screen: pygame.Surface, clock: pygame.time.Clock, result: dict, fonts: dict) -> str:
@@ -644,26 +1081,40 @@ def show_game_over(screen: pygame.Surface, clock: pygame.time.Clock, result: dic
         card_width,
         card_height
     )
+    button_rects = [
+        pygame.Rect(
+            card_rect.x + (card_width - button_width) // 2,
+            card_rect.y + 200 + idx * (button_height + spacing),
+            button_width,
+            button_height
+        )
+        for idx in range(len(buttons))
+    ]
 
+    # As on the start screen, only a change of hovered button needs a redraw
+    full_redraw = True
+    drawn_hover: Optional[int] = None
+    idle = False
     while True:
-        clock.tick(60)
+        clock.tick(IDLE_FPS if idle else ACTIVE_FPS)
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
+                quit_game()
             if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 return "quit"
+            if event.type == pygame.VIDEOEXPOSE:
+                full_redraw = True
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-                for idx, (_, action) in enumerate(buttons):
-                    rect = pygame.Rect(
-                        card_rect.x + (card_width - button_width) // 2,
-                        card_rect.y + 200 + idx * (button_height + spacing),
-                        button_width,
-                        button_height
-                    )
+                for (_, action), rect in zip(buttons, button_rects):
                     if rect.collidepoint(event.pos):
                         return action
 
+        mouse_pos = pygame.mouse.get_pos()
+        hovered = next((idx for idx, rect in enumerate(button_rects) if rect.collidepoint(mouse_pos)), None)
+        idle = not full_redraw and hovered == drawn_hover
+        if idle:
+            continue
+
         #Redraw board as background state
         draw_board(screen, board, [], last_move, "Game Over", difficulty_label, "Game over", fonts)
         screen.blit(overlay, (0, 0))
@@ -671,31 +1122,28 @@ def show_game_over(screen: pygame.Surface, clock: pygame.time.Clock, result: dic
         pygame.draw.rect(screen, PANEL_BG, card_rect, border_radius=30)
         pygame.draw.rect(screen, PANEL_BORDER, card_rect, width=2, border_radius=30)
 
-        title_surface = fonts["title"].render(title_text, True, TEXT_PRIMARY)
-        detail_surface = fonts["subtitle"].render(detail_text, True, TEXT_SECONDARY)
-        score_surface = fonts["body"].render(f"Final score — You: {x_score}  AI: {o_score}", True, TEXT_PRIMARY)
+        title_surface = render_text(fonts["title"], title_text, TEXT_PRIMARY)
+        detail_surface = render_text(fonts["subtitle"], detail_text, TEXT_SECONDARY)
+        score_surface = render_text(fonts["body"], f"Final score — You: {x_score}  AI: {o_score}", TEXT_PRIMARY)
 
         screen.blit(title_surface, title_surface.get_rect(center=(WINDOW_WIDTH // 2, card_rect.y + 80)))
         screen.blit(detail_surface, detail_surface.get_rect(center=(WINDOW_WIDTH // 2, card_rect.y + 120)))
         screen.blit(score_surface, score_surface.get_rect(center=(WINDOW_WIDTH // 2, card_rect.y + 160)))
 
-        mouse_pos = pygame.mouse.get_pos()
-        for idx, (label, _) in enumerate(buttons):
-            rect = pygame.Rect(
-                card_rect.x + (card_width - button_width) // 2,
-                card_rect.y + 200 + idx * (button_height + spacing),
-                button_width,
-                button_height
-            )
-            hovered = rect.collidepoint(mouse_pos)
-            color = (70, 140, 100) if hovered else (52, 112, 80)
+        for idx, ((label, _), rect) in enumerate(zip(buttons, button_rects)):
+            color = (70, 140, 100) if idx == hovered else (52, 112, 80)
             pygame.draw.rect(screen, color, rect, border_radius=18)
             pygame.draw.rect(screen, PANEL_BORDER, rect, width=2, border_radius=18)
 
-            label_surface = fonts["button"].render(label, True, TEXT_PRIMARY)
+            label_surface = render_text(fonts["button"], label, TEXT_PRIMARY)
             screen.blit(label_surface, label_surface.get_rect(center=rect.center))
 
-        pygame.display.flip()
+        if full_redraw:
+            pygame.display.flip()
+        else:
+            pygame.display.update([button_rects[idx] for idx in (drawn_hover, hovered) if idx is not None])
+        full_redraw = False
+        drawn_hover = hovered
 
 
 def run_game():
@@ -725,8 +1173,7 @@ def run_game():
             if action == "difficulty":
                 break
             if action == "quit":
-                pygame.quit()
-                sys.exit()
+                quit_game()
 
 
 if __name__ == '__main__':